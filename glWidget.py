@@ -0,0 +1,224 @@
+import numpy as np
+from platform import system
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QOpenGLWidget
+
+TURN_ANGLE = 4.0
+MOVE = 10
+
+# OpenGL is slow to import, so it's loaded when the GL widget is initialised rather than on start up.
+GL = None
+GLU = None
+GLUT = None
+
+
+def loadGL():
+    global GL, GLU
+    if GL is None:
+        import OpenGL.GL as gl
+        import OpenGL.GLU as glu
+        from OpenGL.arrays import numpymodule
+        numpymodule.NumpyHandler.ERROR_ON_COPY = True
+        GL = gl
+        GLU = glu
+
+
+def loadGLUT():
+    # GLUT is only needed for solid spheres and the shading test, GL_POINTS rendering never touches it.
+    global GLUT
+    if GLUT is None:
+        import OpenGL.GLUT as glut
+        # glutInit() is a system dependent function in PyQt5 framework.
+        # We don't need to, and should not call it in MACOS.
+        # And all glut functions in Windows will cause OpenGL.error.NullFunctionError.
+        if system() == "Linux":
+            glut.glutInit()
+        GLUT = glut
+
+
+# Create OpenGL Widget in the main GUI window
+class OpenGLWidget(QOpenGLWidget):
+    def __init__(self, *args, **kwargs):
+        super(OpenGLWidget, self).__init__(*args, **kwargs)
+        # Enable responds to keyboard.
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.camera = {"eye": np.array([0, 0, 50], np.float64),
+                       "center": np.array([0.0, 0.0, 0.0], np.float64),
+                       "up": np.array([0.0, 1.0, 0.0], np.float64),
+                       "lon": -180,
+                       "lat": 0.0}
+        self.showAxes = True
+        self.showShadingTest = False  # To show I have correct lighting and hidden surface removal.
+        self.r = 0
+        self.usePoint = True
+        self.deathStarWorking = False
+        self.showTail = False
+        self.framesDrawn = 0
+
+    def initializeGL(self):
+        loadGL()
+        GL.glEnable(GL.GL_DEPTH_TEST)
+        GL.glEnable(GL.GL_LIGHTING)
+        GL.glEnable(GL.GL_LIGHT0)
+        GL.glMatrixMode(GL.GL_PROJECTION)
+        GL.glLoadIdentity()
+        GLU.gluPerspective(60, 1, 0.1, 5000)
+        GL.glMatrixMode(GL.GL_MODELVIEW)
+
+    def drawAxes():
+        GL.glBegin(GL.GL_LINES)
+        # Red X.
+        GL.glColor3f(1.0, 0.0, 0.0)
+        GL.glVertex3d(10000, 0.0, 0.0)
+        GL.glVertex3d(0.0, 0.0, 0.0)
+
+        # White Y.
+        GL.glColor3f(1.0, 1.0, 1.0)
+        GL.glVertex3d(0.0, 10000, 0.0)
+        GL.glVertex3d(0.0, 0.0, 0.0)
+
+        # Blue Z.
+        GL.glColor3f(0.078, 0.835, 0.96)
+        GL.glVertex3d(0.0, 0.0, 10000)
+        GL.glVertex3d(0.0, 0.0, 0.0)
+        GL.glEnd()
+        # print("drawAxes")
+
+    def calculateLookAtPoint(self):
+        eye = self.camera["eye"]
+        lon = self.camera["lon"]
+        lat = self.camera["lat"]
+        self.camera["center"][0] = eye[0] + np.cos(np.radians(lat)) * np.sin(np.radians(lon))
+        self.camera["center"][1] = eye[1] + np.sin(np.radians(lat))
+        self.camera["center"][2] = eye[2] + np.cos(np.radians(lat)) * np.cos(np.radians(lon))
+
+    def paintGL(self):
+        GL.glClearColor(0.0, 0.0, 0.0, 0.0)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+        GL.glLoadIdentity()
+        self.calculateLookAtPoint()
+        eye = self.camera["eye"]
+        center = self.camera["center"]
+        up = self.camera["up"]
+        GLU.gluLookAt(eye[0], eye[1], eye[2], center[0], center[1], center[2], up[0], up[1], up[2])
+
+        GL.glDisable(GL.GL_LIGHTING)
+        if self.showAxes:
+            OpenGLWidget.drawAxes()
+
+        if self.deathStarWorking:
+            GL.glBegin(GL.GL_LINES)
+            GL.glColor(0.0, 1.0, 0.0)
+            GL.glVertex3d(10000, 10000, 10000)
+            GL.glVertex3d(-10000, -10000, -10000)
+            GL.glEnd()
+            self.planetsTable.destroyPlanets()
+
+        GL.glEnable(GL.GL_LIGHTING)
+        GL.glShadeModel(GL.GL_SMOOTH)
+
+        if not self.usePoint:
+            loadGLUT()
+        for planet in self.planetsTable.planets:
+            self.paintPlanet(planet)
+
+        if self.showShadingTest:
+            loadGLUT()
+            GL.glColor3f(1.0, 0.0, 0.0)
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_DIFFUSE, list(np.array([1.0, 0.0, 0.0])) + [0.0])
+            GLUT.glutSolidCube(1.0)
+            GL.glRotatef(self.r * 2.0, 0, 1, 0)
+            GL.glTranslatef(0.0, 0.0, 1.0)
+            GL.glRotatef(self.r, 1, 0, 0)
+            GL.glRotatef(self.r, 0, 1, 0)
+            GL.glRotatef(self.r, 0, 0, 1)
+            GL.glColor3f(0.0, 1.0, 0.0)
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_DIFFUSE, list(np.array([0.0, 1.0, 0.0])) + [0.0])
+            GLUT.glutSolidSphere(0.5, 20, 15)
+
+        self.framesDrawn += 1
+
+    def paintPlanet(self, planet):
+        if self.usePoint:
+            GL.glDisable(GL.GL_LIGHTING)
+            GL.glColor3f(*planet.color)
+            GL.glPointSize(10)
+            GL.glBegin(GL.GL_POINTS)
+            GL.glVertex3f(*planet.pos)
+            GL.glEnd()
+            GL.glEnable(GL.GL_LIGHTING)
+        else:
+            GL.glPushMatrix()
+            GL.glTranslatef(*planet.pos)
+            GL.glColor3f(*planet.color)
+            GL.glMaterialfv(GL.GL_FRONT, GL.GL_DIFFUSE, list(planet.color) + [0.0])
+            GLUT.glutSolidSphere(planet.radius, 20, 15)  # This line generates NullFunction Error in Windows 10
+            GL.glPopMatrix()
+
+        if self.showTail:
+            # Paint trace.
+            GL.glDisable(GL.GL_LIGHTING)
+            GL.glBegin(GL.GL_LINE_STRIP)
+            for i in range(planet.currentTraceIndex + 1, len(planet.trace)):
+                if planet.trace[i] is not None:
+                    GL.glVertex3f(*planet.trace[i])
+            for i in range(planet.currentTraceIndex + 1):
+                if planet.trace[i] is not None:
+                    GL.glVertex3f(*planet.trace[i])
+            GL.glEnd()
+            GL.glEnable(GL.GL_LIGHTING)
+
+    def keyPressEvent(self, k):
+        key = k.key()
+        if key == 65:  # 'a'
+            self.showAxes = not self.showAxes
+        elif key == 16777234:  # 'left arrow'
+            self.camera["lon"] += TURN_ANGLE
+        elif key == 16777236:  # 'right arrow'
+            self.camera["lon"] -= TURN_ANGLE
+        elif key == 16777235:  # 'up arrow'
+            if self.camera["lat"] + TURN_ANGLE < 90:
+                self.camera["lat"] += TURN_ANGLE
+        elif key == 16777237:  # 'down arrow'
+            if self.camera["lat"] - TURN_ANGLE > -90:
+                self.camera["lat"] -= TURN_ANGLE
+        elif key == 85:  # 'u'
+            self.camera["eye"][1] += MOVE
+            self.camera["center"][1] += MOVE
+        elif key == 68:  # 'd'
+            self.camera["eye"][1] -= MOVE
+            self.camera["center"][1] -= MOVE
+        elif key == 66:  # 'b'
+            lon = self.camera["lon"]
+            lat = self.camera["lat"]
+            self.camera["eye"][0] -= MOVE * np.sin(np.radians(lon))
+            self.camera["eye"][1] -= MOVE * np.sin(np.radians(lat))
+            self.camera["eye"][2] -= MOVE * np.cos(np.radians(lon))
+        elif key == 70:  # 'f'
+            lon = self.camera["lon"]
+            lat = self.camera["lat"]
+            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon))
+            self.camera["eye"][1] += MOVE * np.sin(np.radians(lat))
+            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon))
+        elif key == 76:  # 'l'
+            lon = self.camera["lon"]
+            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon + 90))
+            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon + 90))
+        elif key == 82:  # 'r'
+            lon = self.camera["lon"]
+            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon - 90))
+            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon - 90))
+        elif key == 84:  # 't'
+            self.showTail = not self.showTail
+        elif key == 83: # 's'
+            self.showShadingTest = not self.showShadingTest
+        elif key == 80:  # 'p'
+            self.usePoint = not self.usePoint
+        elif key == 75:  # 'k'
+            self.deathStarWorking = not self.deathStarWorking
+        else:
+            print("NOT IMPLEMENTED:", key)
+
+    def cameraToString(self):
+        return "(%d, %d, %d, %d, %d)" % (self.camera["eye"][0], self.camera["eye"][1], self.camera["eye"][2],
+                                         self.camera["lat"], self.camera["lon"])
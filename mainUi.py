@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'main.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(925, 780)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.centralwidget)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.openGLWidget = OpenGLWidget(self.centralwidget)
+        self.openGLWidget.setObjectName("openGLWidget")
+        self.horizontalLayout.addWidget(self.openGLWidget)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.addButton = QtWidgets.QPushButton(self.frame)
+        self.addButton.setObjectName("addButton")
+        self.horizontalLayout_2.addWidget(self.addButton)
+        self.removeButton = QtWidgets.QPushButton(self.frame)
+        self.removeButton.setObjectName("removeButton")
+        self.horizontalLayout_2.addWidget(self.removeButton)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.planetsView = QtWidgets.QTableView(self.frame)
+        self.planetsView.setObjectName("planetsView")
+        self.verticalLayout_2.addWidget(self.planetsView)
+        self.verticalLayout.addWidget(self.frame)
+        self.frame_2 = QtWidgets.QFrame(self.centralwidget)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.eyePosLatLonLabel = QtWidgets.QLabel(self.frame_2)
+        self.eyePosLatLonLabel.setObjectName("eyePosLatLonLabel")
+        self.verticalLayout_3.addWidget(self.eyePosLatLonLabel)
+        self.planetsCountLabel = QtWidgets.QLabel(self.frame_2)
+        self.planetsCountLabel.setObjectName("planetsCountLabel")
+        self.verticalLayout_3.addWidget(self.planetsCountLabel)
+        self.shadingTestLabel = QtWidgets.QLabel(self.frame_2)
+        self.shadingTestLabel.setObjectName("shadingTestLabel")
+        self.verticalLayout_3.addWidget(self.shadingTestLabel)
+        self.tailLabel = QtWidgets.QLabel(self.frame_2)
+        self.tailLabel.setObjectName("tailLabel")
+        self.verticalLayout_3.addWidget(self.tailLabel)
+        self.deathStarLabel = QtWidgets.QLabel(self.frame_2)
+        self.deathStarLabel.setObjectName("deathStarLabel")
+        self.verticalLayout_3.addWidget(self.deathStarLabel)
+        self.renderLabel = QtWidgets.QLabel(self.frame_2)
+        self.renderLabel.setObjectName("renderLabel")
+        self.verticalLayout_3.addWidget(self.renderLabel)
+        self.axesLabel = QtWidgets.QLabel(self.frame_2)
+        self.axesLabel.setObjectName("axesLabel")
+        self.verticalLayout_3.addWidget(self.axesLabel)
+        self.tpsLabel = QtWidgets.QLabel(self.frame_2)
+        self.tpsLabel.setObjectName("tpsLabel")
+        self.verticalLayout_3.addWidget(self.tpsLabel)
+        self.fpsLabel = QtWidgets.QLabel(self.frame_2)
+        self.fpsLabel.setObjectName("fpsLabel")
+        self.verticalLayout_3.addWidget(self.fpsLabel)
+        self.label = QtWidgets.QLabel(self.frame_2)
+        self.label.setObjectName("label")
+        self.verticalLayout_3.addWidget(self.label)
+        self.gravitySlider = QtWidgets.QSlider(self.frame_2)
+        self.gravitySlider.setMinimum(1)
+        self.gravitySlider.setMaximum(100)
+        self.gravitySlider.setProperty("value", 10)
+        self.gravitySlider.setOrientation(QtCore.Qt.Horizontal)
+        self.gravitySlider.setObjectName("gravitySlider")
+        self.verticalLayout_3.addWidget(self.gravitySlider)
+        self.label_2 = QtWidgets.QLabel(self.frame_2)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_3.addWidget(self.label_2)
+        self.speedSlider = QtWidgets.QSlider(self.frame_2)
+        self.speedSlider.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.speedSlider.setMinimum(1)
+        self.speedSlider.setMaximum(100)
+        self.speedSlider.setProperty("value", 1)
+        self.speedSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.speedSlider.setObjectName("speedSlider")
+        self.verticalLayout_3.addWidget(self.speedSlider)
+        self.runButton = QtWidgets.QPushButton(self.frame_2)
+        self.runButton.setCheckable(True)
+        self.runButton.setObjectName("runButton")
+        self.verticalLayout_3.addWidget(self.runButton)
+        self.verticalLayout.addWidget(self.frame_2)
+        self.horizontalLayout.addLayout(self.verticalLayout)
+        self.horizontalLayout.setStretch(0, 2)
+        self.horizontalLayout.setStretch(1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 925, 25))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        self.menuHelp.setObjectName("menuHelp")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionQuit = QtWidgets.QAction(MainWindow)
+        self.actionQuit.setObjectName("actionQuit")
+        self.actionSave = QtWidgets.QAction(MainWindow)
+        self.actionSave.setObjectName("actionSave")
+        self.actionLoad = QtWidgets.QAction(MainWindow)
+        self.actionLoad.setObjectName("actionLoad")
+        self.actionShow_Help = QtWidgets.QAction(MainWindow)
+        self.actionShow_Help.setObjectName("actionShow_Help")
+        self.actionCalculate_Ave_FPS = QtWidgets.QAction(MainWindow)
+        self.actionCalculate_Ave_FPS.setObjectName("actionCalculate_Ave_FPS")
+        self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionLoad)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionQuit)
+        self.menuHelp.addAction(self.actionShow_Help)
+        self.menuHelp.addAction(self.actionCalculate_Ave_FPS)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.actionQuit.triggered.connect(MainWindow.close) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "COMP37111 Particle System"))
+        self.addButton.setText(_translate("MainWindow", "Add"))
+        self.removeButton.setText(_translate("MainWindow", "Delete"))
+        self.eyePosLatLonLabel.setText(_translate("MainWindow", "Eye Pos Lat Lon:"))
+        self.planetsCountLabel.setText(_translate("MainWindow", "Planets Count:"))
+        self.shadingTestLabel.setText(_translate("MainWindow", "Shading Test:"))
+        self.tailLabel.setText(_translate("MainWindow", "Tail: "))
+        self.deathStarLabel.setText(_translate("MainWindow", "Death Star:"))
+        self.renderLabel.setText(_translate("MainWindow", "Render:"))
+        self.axesLabel.setText(_translate("MainWindow", "Axes:"))
+        self.tpsLabel.setText(_translate("MainWindow", "Time Per Frame: "))
+        self.fpsLabel.setText(_translate("MainWindow", "FPS: "))
+        self.label.setText(_translate("MainWindow", "Gravity"))
+        self.label_2.setText(_translate("MainWindow", "Speed"))
+        self.runButton.setText(_translate("MainWindow", "Run"))
+        self.menuFile.setTitle(_translate("MainWindow", "&File"))
+        self.menuHelp.setTitle(_translate("MainWindow", "Help"))
+        self.actionQuit.setText(_translate("MainWindow", "&Quit"))
+        self.actionSave.setText(_translate("MainWindow", "&Save"))
+        self.actionLoad.setText(_translate("MainWindow", "&Load"))
+        self.actionShow_Help.setText(_translate("MainWindow", "Show &Help"))
+        self.actionCalculate_Ave_FPS.setText(_translate("MainWindow", "Calculate Ave FPS"))
+from glWidget import OpenGLWidget
@@ -1,20 +1,13 @@
 import sys
 import pickle
 import numpy as np
-from platform import system
 from time import time
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from OpenGL.GLUT import *
 from PyQt5.QtGui import QColor
 from PyQt5.QtCore import QTimer, QAbstractTableModel, Qt
-from PyQt5.QtWidgets import QMainWindow, QApplication, QOpenGLWidget, QMessageBox
-from PyQt5.uic import loadUi
-from OpenGL.arrays import numpymodule
-numpymodule.NumpyHandler.ERROR_ON_COPY = True
+from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox
+# Pre-generated from main.ui by "pyuic5 main.ui -o mainUi.py", which is much faster than loadUi() at start up.
+from mainUi import Ui_MainWindow
 
-TURN_ANGLE = 4.0
-MOVE = 10
 TIME = 0.001
 GRAVITY = 1000
 HEADER = ["Name", "Mass", "PosX", "PosY", "PosZ", "VelX", "VelY", "VelZ"]
@@ -37,36 +30,6 @@ class Planet:
         self.trace = [None] * MAX_TRACE
         self.currentTraceIndex = -1
 
-    def paintPlanet(self, usePoint, showTail):
-        if usePoint:
-            glDisable(GL_LIGHTING)
-            glColor3f(*self.color)
-            glPointSize(10)
-            glBegin(GL_POINTS)
-            glVertex3f(*self.pos)
-            glEnd()
-            glEnable(GL_LIGHTING)
-        else:
-            glPushMatrix()
-            glTranslatef(*self.pos)
-            glColor3f(*self.color)
-            glMaterialfv(GL_FRONT, GL_DIFFUSE, list(self.color) + [0.0])
-            glutSolidSphere(self.radius, 20, 15)  # This line generates NullFunction Error in Windows 10
-            glPopMatrix()
-
-        if showTail:
-            # Paint trace.
-            glDisable(GL_LIGHTING)
-            glBegin(GL_LINE_STRIP)
-            for i in range(self.currentTraceIndex + 1, MAX_TRACE):
-                if self.trace[i] is not None:
-                    glVertex3f(*self.trace[i])
-            for i in range(self.currentTraceIndex + 1):
-                if self.trace[i] is not None:
-                    glVertex3f(*self.trace[i])
-            glEnd()
-            glEnable(GL_LIGHTING)
-
     def toList(self):
         return [self.name, self.mass,
                 self.pos[0], self.pos[1], self.pos[2],
@@ -227,167 +190,11 @@ class PlanetsTable(QAbstractTableModel):
         self.layoutChanged.emit()
 
 
-# Create OpenGL Widget in the main GUI window
-class OpenGLWidget(QOpenGLWidget):
-    def __init__(self, *args, **kwargs):
-        super(OpenGLWidget, self).__init__(*args, **kwargs)
-        # Enable responds to keyboard.
-        self.setFocusPolicy(Qt.StrongFocus)
-        self.camera = {"eye": np.array([0, 0, 50], np.float64),
-                       "center": np.array([0.0, 0.0, 0.0], np.float64),
-                       "up": np.array([0.0, 1.0, 0.0], np.float64),
-                       "lon": -180,
-                       "lat": 0.0}
-        self.showAxes = True
-        self.showShadingTest = False  # To show I have correct lighting and hidden surface removal.
-        self.r = 0
-        self.usePoint = True
-        self.deathStarWorking = False
-        self.showTail = False
-
-    def initializeGL(self):
-        # glutInit() is a system dependent function in PyQt5 framework.
-        # We don't neet to, and should not call it in MACOS.
-        # And all glut functions in Windows will cause OpenGL.error.NullFunctionError.
-        if system() == "Linux":
-            glutInit()
-
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(60, 1, 0.1, 5000)
-        glMatrixMode(GL_MODELVIEW)
-
-    def drawAxes():
-        glBegin(GL_LINES)
-        # Red X.
-        glColor3f(1.0, 0.0, 0.0)
-        glVertex3d(10000, 0.0, 0.0)
-        glVertex3d(0.0, 0.0, 0.0)
-
-        # White Y.
-        glColor3f(1.0, 1.0, 1.0)
-        glVertex3d(0.0, 10000, 0.0)
-        glVertex3d(0.0, 0.0, 0.0)
-
-        # Blue Z.
-        glColor3f(0.078, 0.835, 0.96)
-        glVertex3d(0.0, 0.0, 10000)
-        glVertex3d(0.0, 0.0, 0.0)
-        glEnd()
-        # print("drawAxes")
-
-    def calculateLookAtPoint(self):
-        eye = self.camera["eye"]
-        lon = self.camera["lon"]
-        lat = self.camera["lat"]
-        self.camera["center"][0] = eye[0] + np.cos(np.radians(lat)) * np.sin(np.radians(lon))
-        self.camera["center"][1] = eye[1] + np.sin(np.radians(lat))
-        self.camera["center"][2] = eye[2] + np.cos(np.radians(lat)) * np.cos(np.radians(lon))
-
-    def paintGL(self):
-        glClearColor(0.0, 0.0, 0.0, 0.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        self.calculateLookAtPoint()
-        eye = self.camera["eye"]
-        center = self.camera["center"]
-        up = self.camera["up"]
-        gluLookAt(eye[0], eye[1], eye[2], center[0], center[1], center[2], up[0], up[1], up[2])
-
-        glDisable(GL_LIGHTING)
-        if self.showAxes:
-            OpenGLWidget.drawAxes()
-
-        if self.deathStarWorking:
-            glBegin(GL_LINES)
-            glColor(0.0, 1.0, 0.0)
-            glVertex3d(10000, 10000, 10000)
-            glVertex3d(-10000, -10000, -10000)
-            glEnd()
-            self.planetsTable.destroyPlanets()
-
-        glEnable(GL_LIGHTING)
-        glShadeModel(GL_SMOOTH)
-
-        for planet in self.planetsTable.planets:
-            planet.paintPlanet(self.usePoint, self.showTail)
-
-        if self.showShadingTest:
-            glColor3f(1.0, 0.0, 0.0)
-            glMaterialfv(GL_FRONT, GL_DIFFUSE, list(np.array([1.0, 0.0, 0.0])) + [0.0])
-            glutSolidCube(1.0)
-            glRotatef(self.r * 2.0, 0, 1, 0)
-            glTranslatef(0.0, 0.0, 1.0)
-            glRotatef(self.r, 1, 0, 0)
-            glRotatef(self.r, 0, 1, 0)
-            glRotatef(self.r, 0, 0, 1)
-            glColor3f(0.0, 1.0, 0.0)
-            glMaterialfv(GL_FRONT, GL_DIFFUSE, list(np.array([0.0, 1.0, 0.0])) + [0.0])
-            glutSolidSphere(0.5, 20, 15)
-
-    def keyPressEvent(self, k):
-        key = k.key()
-        if key == 65:  # 'a'
-            self.showAxes = not self.showAxes
-        elif key == 16777234:  # 'left arrow'
-            self.camera["lon"] += TURN_ANGLE
-        elif key == 16777236:  # 'right arrow'
-            self.camera["lon"] -= TURN_ANGLE
-        elif key == 16777235:  # 'up arrow'
-            if self.camera["lat"] + TURN_ANGLE < 90:
-                self.camera["lat"] += TURN_ANGLE
-        elif key == 16777237:  # 'down arrow'
-            if self.camera["lat"] - TURN_ANGLE > -90:
-                self.camera["lat"] -= TURN_ANGLE
-        elif key == 85:  # 'u'
-            self.camera["eye"][1] += MOVE
-            self.camera["center"][1] += MOVE
-        elif key == 68:  # 'd'
-            self.camera["eye"][1] -= MOVE
-            self.camera["center"][1] -= MOVE
-        elif key == 66:  # 'b'
-            lon = self.camera["lon"]
-            lat = self.camera["lat"]
-            self.camera["eye"][0] -= MOVE * np.sin(np.radians(lon))
-            self.camera["eye"][1] -= MOVE * np.sin(np.radians(lat))
-            self.camera["eye"][2] -= MOVE * np.cos(np.radians(lon))
-        elif key == 70:  # 'f'
-            lon = self.camera["lon"]
-            lat = self.camera["lat"]
-            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon))
-            self.camera["eye"][1] += MOVE * np.sin(np.radians(lat))
-            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon))
-        elif key == 76:  # 'l'
-            lon = self.camera["lon"]
-            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon + 90))
-            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon + 90))
-        elif key == 82:  # 'r'
-            lon = self.camera["lon"]
-            self.camera["eye"][0] += MOVE * np.sin(np.radians(lon - 90))
-            self.camera["eye"][2] += MOVE * np.cos(np.radians(lon - 90))
-        elif key == 84:  # 't'
-            self.showTail = not self.showTail
-        elif key == 83: # 's'
-            self.showShadingTest = not self.showShadingTest
-        elif key == 80:  # 'p'
-            self.usePoint = not self.usePoint
-        elif key == 75:  # 'k'
-            self.deathStarWorking = not self.deathStarWorking
-        else:
-            print("NOT IMPLEMENTED:", key)
-
-    def cameraToString(self):
-        return "(%d, %d, %d, %d, %d)" % (self.camera["eye"][0], self.camera["eye"][1], self.camera["eye"][2],
-                                         self.camera["lat"], self.camera["lon"])
-
 # Create the main GUI window.
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
         super(MainWindow, self).__init__()
-        loadUi("main.ui", self)
+        self.setupUi(self)
         # For statistics.
         self.frameStart = time()
         self.frameEnd = 0
@@ -443,7 +250,7 @@ class MainWindow(QMainWindow):
         try:
             with open("statistics.pkl", "wb") as file:
                 pickle.dump(data, file)
-        except Error as e:
+        except OSError as e:
             print(e)
         FPSCount = []
 
@@ -465,7 +272,7 @@ class MainWindow(QMainWindow):
         try:
             with open("planets.pkl", "wb") as file:
                 pickle.dump(self.planetsTable.planets, file)
-        except Error as e:
+        except OSError as e:
             print(e)
 
     def load(self):
@@ -0,0 +1,103 @@
+import os
+import sys
+import pickle
+import subprocess
+import numpy as np
+
+RUNS = 5
+# Times are the median of RUNS fresh interpreters, in seconds.
+IMPORT_BUDGET = 0.25
+# Drawing the first frame depends on the machine's OpenGL driver, so instead of a fixed budget it is compared with a
+# baseline measured on the same machine. Run with --update-baseline to record a new one.
+BASELINE_FILE = "startupBaseline.pkl"
+STARTUP_MARGIN = 0.3
+# These must not be imported by "import n_body" alone.
+IMPORT_LAZY_MODULES = ["OpenGL.GL", "OpenGL.GLU", "OpenGL.GLUT", "PyQt5.uic"]
+# These must still not be imported once the first frame has been drawn with GL_POINTS.
+STARTUP_LAZY_MODULES = ["OpenGL.GLUT", "PyQt5.uic"]
+
+# Time how long "import n_body" takes, then report any module that was loaded too early.
+IMPORT_SCRIPT = """
+import sys
+from time import perf_counter
+start = perf_counter()
+import n_body
+print(perf_counter() - start)
+print(" ".join(name for name in %r if name in sys.modules))
+""" % IMPORT_LAZY_MODULES
+
+# Start up the same way as n_body.main() and time how long it takes until the first frame has been drawn, then report
+# any module that was loaded too early. grabFramebuffer() forces initializeGL() and paintGL() to run, even if the
+# window system hasn't shown the window yet.
+STARTUP_SCRIPT = """
+import sys
+from time import perf_counter
+start = perf_counter()
+import n_body
+app = n_body.QApplication(sys.argv)
+app.setStyle("Fusion")
+mainWindow = n_body.MainWindow()
+mainWindow.show()
+mainWindow.openGLWidget.grabFramebuffer()
+if mainWindow.openGLWidget.framesDrawn == 0:
+    sys.exit("paintGL() never ran, is there an OpenGL context?")
+print(perf_counter() - start)
+print(" ".join(name for name in %r if name in sys.modules))
+""" % STARTUP_LAZY_MODULES
+
+
+def run(script):
+    # Run in a fresh interpreter, otherwise everything after the first run is already imported.
+    result = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(1)
+    return result.stdout.splitlines()
+
+
+def measure(script):
+    times = []
+    eagerModules = set()
+    for _ in range(RUNS):
+        lines = run(script)
+        times.append(float(lines[0]))
+        if len(lines) > 1:
+            eagerModules.update(lines[1].split())
+    return np.median(times), eagerModules
+
+
+def main():
+    importTime, importEagerModules = measure(IMPORT_SCRIPT)
+    startupTime, startupEagerModules = measure(STARTUP_SCRIPT)
+    print("Import:      %.4fs (budget %.4fs)" % (importTime, IMPORT_BUDGET))
+
+    failed = False
+    if importTime > IMPORT_BUDGET:
+        print("Import time is over budget.")
+        failed = True
+
+    baselinePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), BASELINE_FILE)
+    if "--update-baseline" in sys.argv or not os.path.exists(baselinePath):
+        with open(baselinePath, "wb") as file:
+            pickle.dump(startupTime, file)
+        print("First frame: %.4fs (recorded as the new baseline in %s)" % (startupTime, BASELINE_FILE))
+    else:
+        with open(baselinePath, "rb") as file:
+            startupBudget = pickle.load(file) * (1 + STARTUP_MARGIN)
+        print("First frame: %.4fs (budget %.4fs)" % (startupTime, startupBudget))
+        if startupTime > startupBudget:
+            print("First frame time is over budget.")
+            failed = True
+
+    if importEagerModules:
+        print("Loaded by import, but should be lazy:", ", ".join(sorted(importEagerModules)))
+        failed = True
+    if startupEagerModules:
+        print("Loaded by the first frame, but should be lazy:", ", ".join(sorted(startupEagerModules)))
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()